@@ -1,14 +1,21 @@
-from dataclasses import dataclass
-from typing import Dict, List
+from typing import List, NamedTuple
 
 import csv
-from experta import KnowledgeEngine, Fact, Rule, MATCH, TEST
+import sys
 
 
 # ---------- Data models ----------
 
-@dataclass
-class Event:
+# Categorical columns are stored as small ints; the *_REV tuples map back.
+_STATUS = {"OK": 0, "WARNING": 1, "CRITICAL": 2}
+_TRAFFIC = {"LOW": 0, "MEDIUM": 1, "HIGH": 2}
+_STATUS_REV = ("OK", "WARNING", "CRITICAL")
+_TRAFFIC_REV = ("LOW", "MEDIUM", "HIGH")
+_OK, _WARNING, _CRITICAL = _STATUS["OK"], _STATUS["WARNING"], _STATUS["CRITICAL"]
+_HIGH = _TRAFFIC["HIGH"]
+
+
+class Event(NamedTuple):
     event_id: int
     service_name: str
     region: str
@@ -17,337 +24,492 @@ class Event:
     disk_percent: float
     response_time_ms: float
     error_rate_percent: float
-    status: str
-    traffic_level: str
+    status: int          # _STATUS code
+    traffic_level: int   # _TRAFFIC code
     previous_restarts: int
-    is_business_hours: bool
+    is_business_hours: int  # 0 or 1
 
 
-@dataclass
-class Decision:
+class Decision(NamedTuple):
     action: str
     reason: str
     severity: str = "INFO"
 
 
-# ---------- Experta facts ----------
-
-class EventFact(Fact):
-    """Fact representing an IT ops event."""
-    pass
-
-
-# ---------- Remediation Expert System using experta ----------
-
-class RemediationEngine(KnowledgeEngine):
-    def __init__(self):
-        super().__init__()
-        # event_id -> Decision
-        self.decisions: Dict[int, Decision] = {}
-
-    def _set_decision_once(self, event_id: int, decision: Decision):
-        """Ensure only the first (highest priority) rule sets a decision."""
-        if event_id in self.decisions:
-            return
-        self.decisions[event_id] = decision
-
-    # 1. Escalate if we've retried too many times and it's still critical
-    @Rule(
-        EventFact(status="CRITICAL",
-                  event_id=MATCH.eid,
-                  previous_restarts=MATCH.prev),
-        TEST(lambda prev: prev >= 3),
-        salience=100  # higher = higher priority
-    )
-    def escalate_after_retries(self, eid, prev):
-        self._set_decision_once(
-            eid,
-            Decision(
-                action="ESCALATE_TO_ONCALL",
-                reason=f"[ESCALATE_AFTER_RETRIES] Still CRITICAL after {prev} restarts.",
-                severity="CRITICAL",
-            ),
-        )
-
-    # 2. Scale out under high load & high CPU
-    @Rule(
-        EventFact(status=MATCH.status,
-                  traffic_level="HIGH",
-                  cpu_percent=MATCH.cpu,
-                  event_id=MATCH.eid),
-        TEST(lambda status, cpu: status in ("WARNING", "CRITICAL") and cpu >= 85),
-        salience=90
-    )
-    def scale_out_under_high_load(self, eid, status, cpu):
-        self._set_decision_once(
-            eid,
-            Decision(
-                action="SCALE_OUT",
-                reason=(
-                    f"[SCALE_OUT_UNDER_HIGH_LOAD] Status={status}, CPU={cpu}% "
-                    f"under HIGH traffic."
-                ),
-                severity="HIGH",
-            ),
-        )
-
-    # 3. Free disk space when nearly full
-    @Rule(
-        EventFact(disk_percent=MATCH.disk, event_id=MATCH.eid),
-        TEST(lambda disk: disk >= 90),
-        salience=80
-    )
-    def free_disk_space(self, eid, disk):
-        self._set_decision_once(
-            eid,
-            Decision(
-                action="CLEAR_LOGS_AND_TMP",
-                reason=f"[FREE_DISK_SPACE] Disk at {disk}%.",
-                severity="HIGH",
-            ),
-        )
+# ---------- Fast decision cascade ----------
+
+# Remediation rules, highest priority first (the first match wins).
+# Conditions and reason args are Python expressions over _RULE_FIELDS;
+# {NAME} placeholders in conditions are replaced by _STATUS/_TRAFFIC codes.
+# (name, condition, action, reason template, reason args, severity)
+RULES = (
+    ("escalate_after_retries",
+     "status == {CRITICAL} and previous_restarts >= 3",
+     "ESCALATE_TO_ONCALL",
+     "[ESCALATE_AFTER_RETRIES] Still CRITICAL after {} restarts.",
+     ("previous_restarts",),
+     "CRITICAL"),
+    ("scale_out_under_high_load",
+     "traffic_level == {HIGH} and status >= {WARNING} and cpu_percent >= 85",
+     "SCALE_OUT",
+     "[SCALE_OUT_UNDER_HIGH_LOAD] Status={}, CPU={}% under HIGH traffic.",
+     ("_STATUS_REV[status]", "cpu_percent"),
+     "HIGH"),
+    ("free_disk_space",
+     "disk_percent >= 90",
+     "CLEAR_LOGS_AND_TMP",
+     "[FREE_DISK_SPACE] Disk at {}%.",
+     ("disk_percent",),
+     "HIGH"),
+    ("rollback_on_high_errors",
+     "status == {CRITICAL} and error_rate_percent >= 5.0",
+     "ROLLBACK_DEPLOYMENT",
+     "[ROLLBACK_ON_HIGH_ERRORS] Error rate={}%.",
+     ("error_rate_percent",),
+     "CRITICAL"),
+    ("restart_unresponsive_service",
+     "status == {CRITICAL} and previous_restarts < 3",
+     "RESTART_SERVICE",
+     "[RESTART_UNRESPONSIVE_SERVICE] CRITICAL, prev_restarts={}.",
+     ("previous_restarts",),
+     "CRITICAL"),
+    ("page_oncall_off_hours",
+     "status == {CRITICAL} and is_business_hours == 0",
+     "PAGE_ONCALL",
+     "[PAGE_ONCALL_OFF_HOURS] Critical issue outside business hours.",
+     (),
+     "CRITICAL"),
+    ("investigate_backend_latency",
+     "response_time_ms > 1000 and cpu_percent < 70",
+     "OPEN_INVESTIGATION_TICKET",
+     "[INVESTIGATE_BACKEND_LATENCY] High latency={}ms, CPU={}% (likely downstream/backend issue).",
+     ("response_time_ms", "cpu_percent"),
+     "MEDIUM"),
+    ("no_action_ok",
+     "status == {OK}",
+     "NO_ACTION",
+     "[NO_ACTION_OK] Service healthy.",
+     (),
+     "INFO"),
+)
+
+_RULE_FIELDS = (
+    "status",
+    "traffic_level",
+    "cpu_percent",
+    "disk_percent",
+    "response_time_ms",
+    "error_rate_percent",
+    "previous_restarts",
+    "is_business_hours",
+)
+
+
+def _compile_rules(rules) -> str:
+    """Generate the source of _decide(): one literal `if` per rule."""
+    lines = [f"def _decide({', '.join(_RULE_FIELDS)}):"]
+    for name, condition, action, template, args, severity in rules:
+        reason = repr(template)
+        if args:
+            reason += f".format({', '.join(args)})"
+        condition = condition.format(**_STATUS, **_TRAFFIC)
+        lines.append(f"    if {condition}:  # {name}")
+        if args:
+            lines.append(f"        return Decision({action!r}, {reason}, {severity!r})")
+        else:
+            # Reason has no per-event values: return the shared instance.
+            lines.append(f"        return _{name}")
+    lines.append("    return _DEFAULT_DECISION")
+    return "\n".join(lines) + "\n"
+
+
+# Shared decision for events that no rule matches.
+_DEFAULT_DECISION = Decision("NO_DECISION", "[DEFAULT] No rule fired.", "INFO")
+
+_DECIDE_SOURCE = _compile_rules(RULES)
+_namespace = {
+    "Decision": Decision,
+    "_STATUS_REV": _STATUS_REV,
+    "_DEFAULT_DECISION": _DEFAULT_DECISION,
+}
+_namespace.update(
+    (f"_{name}", Decision(action, template, severity))
+    for name, _, action, template, args, severity in RULES
+    if not args
+)
+exec(compile(_DECIDE_SOURCE, "<rules>", "exec"), _namespace)
+_decide = _namespace["_decide"]
+
+# Shared decision for healthy events (the no_action_ok outcome).
+_OK_DECISION = _namespace["_no_action_ok"]
+
+
+def decide(e: Event) -> Decision:
+    """
+    Pick the remediation for a single event.
+    Dispatches to _decide(), compiled once from RULES at import time.
 
-    # 4. Rollback when errors are very high and status is critical
-    @Rule(
-        EventFact(error_rate_percent=MATCH.err,
-                  status="CRITICAL",
-                  event_id=MATCH.eid),
-        TEST(lambda err: err >= 5.0),
-        salience=70
+    Not memoized: a cache keyed on the rule predicates (status, traffic,
+    cpu>=85, disk>=90, ...) needs the same comparisons to build the key,
+    plus a tuple and a dict lookup, and measured ~1.4x slower than the
+    cascade itself.
+    """
+    return _decide(
+        e.status,
+        e.traffic_level,
+        e.cpu_percent,
+        e.disk_percent,
+        e.response_time_ms,
+        e.error_rate_percent,
+        e.previous_restarts,
+        e.is_business_hours,
     )
-    def rollback_on_high_errors(self, eid, err):
-        self._set_decision_once(
-            eid,
-            Decision(
-                action="ROLLBACK_DEPLOYMENT",
-                reason=f"[ROLLBACK_ON_HIGH_ERRORS] Error rate={err}%.",
-                severity="CRITICAL",
-            ),
-        )
 
-    # 5. Restart unresponsive / critical service if we haven't retried too many times
-    @Rule(
-        EventFact(status="CRITICAL",
-                  previous_restarts=MATCH.prev,
-                  event_id=MATCH.eid),
-        TEST(lambda prev: prev < 3),
-        salience=60
-    )
-    def restart_unresponsive_service(self, eid, prev):
-        self._set_decision_once(
-            eid,
-            Decision(
-                action="RESTART_SERVICE",
-                reason=f"[RESTART_UNRESPONSIVE_SERVICE] CRITICAL, prev_restarts={prev}.",
-                severity="CRITICAL",
-            ),
-        )
 
-    # 6. Page on-call if critical outside business hours
-    @Rule(
-        EventFact(status="CRITICAL",
-                  is_business_hours=0,
-                  event_id=MATCH.eid),
-        salience=50
-    )
-    def page_oncall_off_hours(self, eid):
-        self._set_decision_once(
-            eid,
-            Decision(
-                action="PAGE_ONCALL",
-                reason="[PAGE_ONCALL_OFF_HOURS] Critical issue outside business hours.",
-                severity="CRITICAL",
-            ),
-        )
+def _decide_one(e: Event) -> Decision:
+    """decide() with a fast path for healthy events."""
+    # Ahead of no_action_ok, an OK event can only match free_disk_space
+    # or investigate_backend_latency; otherwise skip the cascade.
+    # Repeats their thresholds; tests/test_decisions.py checks against decide().
+    if (e.status == _OK
+            and e.disk_percent < 90
+            and (e.response_time_ms <= 1000 or e.cpu_percent >= 70)):
+        return _OK_DECISION
+    return decide(e)
 
-    # 7. Investigate high latency with normal CPU
-    @Rule(
-        EventFact(response_time_ms=MATCH.rt,
-                  cpu_percent=MATCH.cpu,
-                  event_id=MATCH.eid),
-        TEST(lambda rt, cpu: rt > 1000 and cpu < 70),
-        salience=40
-    )
-    def investigate_backend_latency(self, eid, rt, cpu):
-        self._set_decision_once(
-            eid,
-            Decision(
-                action="OPEN_INVESTIGATION_TICKET",
-                reason=(
-                    f"[INVESTIGATE_BACKEND_LATENCY] High latency={rt}ms, "
-                    f"CPU={cpu}% (likely downstream/backend issue)."
-                ),
-                severity="MEDIUM",
-            ),
-        )
 
-    # 8. No action for OK events (low priority)
-    @Rule(
-        EventFact(status="OK", event_id=MATCH.eid),
-        salience=1
-    )
-    def no_action_ok(self, eid):
-        self._set_decision_once(
-            eid,
-            Decision(
-                action="NO_ACTION",
-                reason="[NO_ACTION_OK] Service healthy.",
-                severity="INFO",
-            ),
-        )
+# ---------- Automation stub (execution layer) ----------
 
+# Number of events between writes of buffered execute_action() output.
+_FLUSH_EVERY = 1024
 
-# ---------- Automation stub (execution layer) ----------
 
-def execute_action(event: Event, decision: Decision) -> None:
+def execute_action(event: Event, decision: Decision, buf: List[str]) -> None:
     """
     Stub for the automation layer.
     Replace prints with calls to:
       - Ansible, Terraform, AWS, Kubernetes, shell scripts, etc.
+    Output lines are appended to `buf`; the caller writes them out in batches.
     """
     if decision.action == "NO_ACTION":
         return
 
-    print(
+    buf.append(
         f"[EXECUTE] event_id={event.event_id} "
         f"service={event.service_name} "
         f"action={decision.action} "
         f"severity={decision.severity} "
-        f"reason={decision.reason}"
+        f"reason={decision.reason}\n"
     )
 
 
 # ---------- CSV helpers ----------
 
+# Output columns: the input event columns followed by the decision.
+OUTPUT_FIELDNAMES = [
+    "event_id",
+    "service_name",
+    "region",
+    "cpu_percent",
+    "memory_percent",
+    "disk_percent",
+    "response_time_ms",
+    "error_rate_percent",
+    "status",
+    "traffic_level",
+    "previous_restarts",
+    "is_business_hours",
+    "recommended_action",
+    "action_reason",
+    "action_severity",
+]
+
+# Input columns, in the order load_events_from_csv() reads them by position.
+EVENT_FIELDNAMES = OUTPUT_FIELDNAMES[:12]
+
+
+def _unknown_value(event_id, column: str, value: str, codes) -> ValueError:
+    """Error for a status / traffic_level value that has no int code."""
+    return ValueError(
+        f"event_id {event_id}: unknown {column} {value!r} "
+        f"(expected one of {', '.join(codes)})"
+    )
+
+
 def load_events_from_csv(path: str) -> List[Event]:
     events: List[Event] = []
     with open(path, newline="") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:  # empty file: no events
+            return events
+        if header != EVENT_FIELDNAMES:
+            raise ValueError(
+                f"{path}: expected columns {EVENT_FIELDNAMES}, got {header}"
+            )
         for row in reader:
+            if not row:  # blank line, skipped like DictReader / pd.read_csv
+                continue
+            try:
+                status = _STATUS[row[8]]
+                traffic = _TRAFFIC[row[9]]
+            except KeyError:
+                if row[8] not in _STATUS:
+                    raise _unknown_value(row[0], "status", row[8], _STATUS) from None
+                raise _unknown_value(row[0], "traffic_level", row[9], _TRAFFIC) from None
+
             events.append(
                 Event(
-                    event_id=int(row["event_id"]),
-                    service_name=row["service_name"],
-                    region=row["region"],
-                    cpu_percent=float(row["cpu_percent"]),
-                    memory_percent=float(row["memory_percent"]),
-                    disk_percent=float(row["disk_percent"]),
-                    response_time_ms=float(row["response_time_ms"]),
-                    error_rate_percent=float(row["error_rate_percent"]),
-                    status=row["status"],
-                    traffic_level=row["traffic_level"],
-                    previous_restarts=int(row["previous_restarts"]),
-                    is_business_hours=bool(int(row["is_business_hours"])),
+                    int(row[0]),
+                    row[1],
+                    row[2],
+                    float(row[3]),
+                    float(row[4]),
+                    float(row[5]),
+                    float(row[6]),
+                    float(row[7]),
+                    status,
+                    traffic,
+                    int(row[10]),
+                    int(row[11]),
                 )
             )
     return events
 
 
-def save_decisions_to_csv(path: str,
-                          events: List[Event],
-                          decisions: Dict[int, Decision]) -> None:
-    with open(path, "w", newline="") as f:
-        fieldnames = [
-            "event_id",
-            "service_name",
-            "region",
-            "cpu_percent",
-            "memory_percent",
-            "disk_percent",
-            "response_time_ms",
-            "error_rate_percent",
-            "status",
-            "traffic_level",
-            "previous_restarts",
-            "is_business_hours",
-            "recommended_action",
-            "action_reason",
-            "action_severity",
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for e in events:
-            d = decisions.get(
-                e.event_id,
-                Decision(
-                    action="NO_DECISION",
-                    reason="No matching rule fired.",
-                    severity="INFO",
-                ),
-            )
-            writer.writerow(
-                {
-                    "event_id": e.event_id,
-                    "service_name": e.service_name,
-                    "region": e.region,
-                    "cpu_percent": e.cpu_percent,
-                    "memory_percent": e.memory_percent,
-                    "disk_percent": e.disk_percent,
-                    "response_time_ms": e.response_time_ms,
-                    "error_rate_percent": e.error_rate_percent,
-                    "status": e.status,
-                    "traffic_level": e.traffic_level,
-                    "previous_restarts": e.previous_restarts,
-                    "is_business_hours": int(e.is_business_hours),
-                    "recommended_action": d.action,
-                    "action_reason": d.reason,
-                    "action_severity": d.severity,
-                }
-            )
+# ---------- Vectorized batch path (numpy / pandas / numba) ----------
+
+_BATCH_KERNEL = None
+
+
+def _batch_kernel():
+    """
+    Build (once) the Numba-compiled rule kernel.
+    Raises ImportError when numba is not installed.
+    """
+    global _BATCH_KERNEL
+    if _BATCH_KERNEL is None:
+        from numba import njit, prange
+
+        @njit(parallel=True, cache=True)
+        def decide_batch(status, traffic, cpu, disk, err, rt, prev, biz, out_action):
+            # out_action[i] = index into RULES of the first matching rule, or -1.
+            # Mirrors RULES by hand; tests/test_decisions.py checks they agree.
+            for i in prange(status.shape[0]):
+                s = status[i]
+                if s == _CRITICAL and prev[i] >= 3:
+                    out_action[i] = 0  # escalate_after_retries
+                elif s >= _WARNING and traffic[i] == _HIGH and cpu[i] >= 85:
+                    out_action[i] = 1  # scale_out_under_high_load
+                elif disk[i] >= 90:
+                    out_action[i] = 2  # free_disk_space
+                elif s == _CRITICAL and err[i] >= 5.0:
+                    out_action[i] = 3  # rollback_on_high_errors
+                elif s == _CRITICAL and prev[i] < 3:
+                    out_action[i] = 4  # restart_unresponsive_service
+                elif s == _CRITICAL and biz[i] == 0:
+                    out_action[i] = 5  # page_oncall_off_hours
+                elif rt[i] > 1000 and cpu[i] < 70:
+                    out_action[i] = 6  # investigate_backend_latency
+                elif s == _OK:
+                    out_action[i] = 7  # no_action_ok
+                else:
+                    out_action[i] = -1
+
+        _BATCH_KERNEL = decide_batch
+    return _BATCH_KERNEL
+
+
+def _encode_column(df, column: str, codes):
+    """Map a categorical column to int codes, rejecting unknown values like the loader."""
+    import numpy as np
+
+    encoded = df[column].map(codes)
+    unknown = encoded.isna().to_numpy()
+    if unknown.any():
+        i = unknown.argmax()
+        raise _unknown_value(df["event_id"].iloc[i], column, df[column].iloc[i], codes)
+    return encoded.to_numpy(np.int8)
+
+
+def _rule_columns(df):
+    """The _RULE_FIELDS columns as numpy arrays, coded like _decide()'s arguments."""
+    import numpy as np
+
+    return {
+        "status": _encode_column(df, "status", _STATUS),
+        "traffic_level": _encode_column(df, "traffic_level", _TRAFFIC),
+        "cpu_percent": df["cpu_percent"].to_numpy(np.float64),
+        "disk_percent": df["disk_percent"].to_numpy(np.float64),
+        "response_time_ms": df["response_time_ms"].to_numpy(np.float64),
+        "error_rate_percent": df["error_rate_percent"].to_numpy(np.float64),
+        "previous_restarts": df["previous_restarts"].to_numpy(np.int32),
+        "is_business_hours": df["is_business_hours"].to_numpy(np.int8),
+    }
+
+
+def _rule_codes(cols):
+    """Index into RULES of the first matching rule per row, or -1."""
+    import numpy as np
+
+    status = cols["status"]
+    cpu = cols["cpu_percent"]
+    prev = cols["previous_restarts"]
+
+    try:
+        kernel = _batch_kernel()
+    except ImportError:
+        kernel = None
+
+    if kernel is not None:
+        codes = np.empty(len(status), dtype=np.int8)
+        kernel(
+            status,
+            cols["traffic_level"],
+            cpu,
+            cols["disk_percent"],
+            cols["error_rate_percent"],
+            cols["response_time_ms"],
+            prev,
+            cols["is_business_hours"],
+            codes,
+        )
+        return codes
+
+    # Without numba: one boolean mask per rule, np.select keeps the first match.
+    # Mirrors RULES by hand; tests/test_decisions.py checks they agree.
+    critical = status == _CRITICAL
+
+    conditions = [
+        critical & (prev >= 3),
+        (status >= _WARNING) & (cols["traffic_level"] == _HIGH) & (cpu >= 85),
+        cols["disk_percent"] >= 90,
+        critical & (cols["error_rate_percent"] >= 5.0),
+        critical & (prev < 3),
+        critical & (cols["is_business_hours"] == 0),
+        (cols["response_time_ms"] > 1000) & (cpu < 70),
+        status == _OK,
+    ]
+    return np.select(conditions, np.arange(len(conditions), dtype=np.int8), default=-1)
+
+
+def _rule_reasons(cols, codes):
+    """Format each row's reason from the RULES template and args of its rule."""
+    import numpy as np
+
+    namespace = {"_STATUS_REV": np.array(_STATUS_REV, dtype=object)}
+    reasons = np.full(len(codes), _DEFAULT_DECISION.reason, dtype=object)
+
+    for k, (_, _, _, template, args, _) in enumerate(RULES):
+        rows = codes == k
+        if not args:
+            reasons[rows] = template
+            continue
+        # Arg expressions are evaluated over the matching rows; tolist()
+        # gives Python scalars, so values print as they do in _decide().
+        fields = {name: col[rows] for name, col in cols.items()}
+        values = [np.asarray(eval(arg, namespace, fields)).tolist() for arg in args]
+        reasons[rows] = [template.format(*v) for v in zip(*values)]
+
+    return reasons
+
+
+def decide_frame(df):
+    """
+    Vectorized equivalent of decide() over a whole DataFrame of events.
+    Rule matching runs in a Numba kernel when numba is available and
+    falls back to numpy masks otherwise; codes are mapped back to strings
+    once at the end. Adds recommended_action / action_reason /
+    action_severity columns.
+    """
+    import numpy as np
+
+    cols = _rule_columns(df)
+    codes = _rule_codes(cols)
+
+    # The default outcome is appended last so that code -1 indexes it.
+    actions = np.array([r[2] for r in RULES] + [_DEFAULT_DECISION.action], dtype=object)
+    severities = np.array([r[5] for r in RULES] + [_DEFAULT_DECISION.severity], dtype=object)
+
+    df["recommended_action"] = actions[codes]
+    df["action_reason"] = _rule_reasons(cols, codes)
+    df["action_severity"] = severities[codes]
+    return df
+
+
+def run_vectorized(input_csv: str, output_csv: str) -> None:
+    """
+    Load, decide and save all events in one vectorized pass.
+    Decisions only: the execution layer is not called on this path.
+    """
+    import pandas as pd
+
+    # Metrics are read as floats so they print the same as the scalar path.
+    df = pd.read_csv(
+        input_csv,
+        dtype={
+            "cpu_percent": float,
+            "memory_percent": float,
+            "disk_percent": float,
+            "response_time_ms": float,
+            "error_rate_percent": float,
+        },
+    )
+    decide_frame(df).to_csv(output_csv, index=False, lineterminator="\r\n")
 
 
 # ---------- Main demo ----------
 
-def main():
+def main(vectorized: bool = False):
     input_csv = "it_ops_events.csv"
     output_csv = "it_ops_events_with_actions_experta.csv"
 
+    if vectorized:
+        print(f"Processing {input_csv} in vectorized mode ...")
+        run_vectorized(input_csv, output_csv)
+        print(f"\nDone. Decisions saved to: {output_csv}")
+        return
+
     print(f"Loading events from {input_csv} ...")
     events = load_events_from_csv(input_csv)
 
-    decisions: Dict[int, Decision] = {}
-
-    for e in events:
-        engine = RemediationEngine()
-        engine.reset()
-
-        # Insert one EventFact into the expert system for this event
-        engine.declare(
-            EventFact(
-                event_id=e.event_id,
-                service_name=e.service_name,
-                region=e.region,
-                cpu_percent=e.cpu_percent,
-                memory_percent=e.memory_percent,
-                disk_percent=e.disk_percent,
-                response_time_ms=e.response_time_ms,
-                error_rate_percent=e.error_rate_percent,
-                status=e.status,
-                traffic_level=e.traffic_level,
-                previous_restarts=e.previous_restarts,
-                is_business_hours=int(e.is_business_hours),
-            )
-        )
+    # Decide, execute and write each event in a single pass.
+    with open(output_csv, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(OUTPUT_FIELDNAMES)
 
-        engine.run()
+        buf: List[str] = []
+        for i, e in enumerate(events, 1):
+            decision = _decide_one(e)
+            execute_action(e, decision, buf)
+            if i % _FLUSH_EVERY == 0:
+                sys.stdout.write("".join(buf))
+                buf.clear()
 
-        # Read decision from engine
-        decision = engine.decisions.get(
-            e.event_id,
-            Decision(
-                action="NO_DECISION",
-                reason="[DEFAULT] No rule fired.",
-                severity="INFO",
-            ),
-        )
-        decisions[e.event_id] = decision
+            writer.writerow(
+                (
+                    e.event_id,
+                    e.service_name,
+                    e.region,
+                    e.cpu_percent,
+                    e.memory_percent,
+                    e.disk_percent,
+                    e.response_time_ms,
+                    e.error_rate_percent,
+                    _STATUS_REV[e.status],
+                    _TRAFFIC_REV[e.traffic_level],
+                    e.previous_restarts,
+                    e.is_business_hours,
+                    decision.action,
+                    decision.reason,
+                    decision.severity,
+                )
+            )
 
-        execute_action(e, decision)
+        sys.stdout.write("".join(buf))
 
-    save_decisions_to_csv(output_csv, events, decisions)
     print(f"\nDone. Decisions saved to: {output_csv}")
 
 
 if __name__ == "__main__":
-    main()
+    main(vectorized="--vectorized" in sys.argv[1:])
@@ -0,0 +1,15 @@
+"""Load code/code.py once per session as the `remediation` module."""
+import importlib.util
+import os
+import sys
+
+CODE_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "code")
+
+# code.py would shadow the stdlib `code` module, so load it under another name.
+# Registering it in sys.modules lets the test files `import remediation` and
+# lets numba reload its cached kernel.
+if "remediation" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location("remediation", os.path.join(CODE_DIR, "code.py"))
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules["remediation"] = _module
+    _spec.loader.exec_module(_module)
@@ -0,0 +1,89 @@
+"""The scalar cascade and the vectorized batch path must agree on every row."""
+import ast
+import itertools
+import os
+
+import pytest
+
+import remediation  # loaded by conftest.py
+
+EVENTS_CSV = os.path.join(os.path.dirname(__file__), os.pardir, "code", "it_ops_events.csv")
+
+
+def _threshold_grid():
+    """
+    Events just below, at and above every threshold that appears in RULES,
+    for every status and traffic level.
+    """
+    values = {name: set() for name in remediation._RULE_FIELDS}
+    for _, condition, *_ in remediation.RULES:
+        tree = ast.parse(condition.format(**remediation._STATUS, **remediation._TRAFFIC))
+        for node in ast.walk(tree):
+            if (isinstance(node, ast.Compare)
+                    and isinstance(node.left, ast.Name)
+                    and isinstance(node.comparators[0], ast.Constant)):
+                c = node.comparators[0].value
+                values[node.left.id].update((c - 1, c, c + 1))
+    values["status"] = set(remediation._STATUS.values())
+    values["traffic_level"] = set(remediation._TRAFFIC.values())
+
+    names = remediation._RULE_FIELDS
+    for combo in itertools.product(*(sorted(values[n]) for n in names)):
+        # Coerce like load_events_from_csv() so reasons print the same.
+        fields = {n: remediation.Event.__annotations__[n](v) for n, v in zip(names, combo)}
+        yield remediation.Event(
+            event_id=0,
+            service_name="svc",
+            region="region",
+            memory_percent=50.0,
+            **fields,
+        )
+
+
+def _events():
+    """The sample events plus the threshold grid."""
+    return remediation.load_events_from_csv(EVENTS_CSV) + list(_threshold_grid())
+
+
+def _scalar_decisions(events):
+    return [(d.action, d.reason, d.severity) for d in map(remediation.decide, events)]
+
+
+def _frame_decisions(events):
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(events, columns=remediation.EVENT_FIELDNAMES)
+    df["status"] = [remediation._STATUS_REV[s] for s in df["status"]]
+    df["traffic_level"] = [remediation._TRAFFIC_REV[t] for t in df["traffic_level"]]
+    for column in ("cpu_percent", "memory_percent", "disk_percent",
+                   "response_time_ms", "error_rate_percent"):
+        df[column] = df[column].astype(float)
+    df = remediation.decide_frame(df)
+    return list(zip(df["recommended_action"], df["action_reason"], df["action_severity"]))
+
+
+def test_decide_frame_matches_decide_with_kernel():
+    pytest.importorskip("numba")
+    events = _events()
+    assert _frame_decisions(events) == _scalar_decisions(events)
+
+
+def test_decide_frame_matches_decide_without_kernel(monkeypatch):
+    def no_numba():
+        raise ImportError("numba disabled for this test")
+
+    monkeypatch.setattr(remediation, "_batch_kernel", no_numba)
+    events = _events()
+    assert _frame_decisions(events) == _scalar_decisions(events)
+
+
+def test_decide_frame_rejects_unknown_status_like_the_loader():
+    pd = pytest.importorskip("pandas")
+    df = pd.read_csv(EVENTS_CSV)
+    df.loc[3, "status"] = "ok"
+    with pytest.raises(ValueError, match="event_id 4: unknown status 'ok'"):
+        remediation.decide_frame(df)
+
+
+def test_ok_fast_path_matches_decide():
+    events = _events()
+    assert [remediation._decide_one(e) for e in events] == [remediation.decide(e) for e in events]
@@ -0,0 +1,43 @@
+"""load_events_from_csv() rejects input it would otherwise misread."""
+import pytest
+
+import remediation  # loaded by conftest.py
+
+HEADER = ",".join(remediation.EVENT_FIELDNAMES)
+ROW = "1,auth-service,us-east-1,57,89,43,801,1.79,WARNING,HIGH,0,1"
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "events.csv"
+    path.write_text(text)
+    return str(path)
+
+
+def test_loads_rows_in_expected_column_order(tmp_path):
+    [event] = remediation.load_events_from_csv(_write(tmp_path, f"{HEADER}\n{ROW}\n"))
+    assert event.cpu_percent == 57.0
+    assert event.memory_percent == 89.0
+
+
+def test_blank_lines_are_skipped(tmp_path):
+    events = remediation.load_events_from_csv(_write(tmp_path, f"{HEADER}\n\n{ROW}\n\n"))
+    assert [e.event_id for e in events] == [1]
+
+
+def test_empty_file_has_no_events(tmp_path):
+    assert remediation.load_events_from_csv(_write(tmp_path, "")) == []
+
+
+def test_reordered_columns_are_rejected(tmp_path):
+    header = HEADER.replace("cpu_percent,memory_percent", "memory_percent,cpu_percent")
+    with pytest.raises(ValueError, match="expected columns"):
+        remediation.load_events_from_csv(_write(tmp_path, f"{header}\n{ROW}\n"))
+
+
+@pytest.mark.parametrize("row, message", [
+    (ROW.replace("WARNING", "ok"), "event_id 1: unknown status 'ok'"),
+    (ROW.replace("HIGH", "high"), "event_id 1: unknown traffic_level 'high'"),
+])
+def test_unknown_categories_are_rejected(tmp_path, row, message):
+    with pytest.raises(ValueError, match=message):
+        remediation.load_events_from_csv(_write(tmp_path, f"{HEADER}\n{row}\n"))